@@ -20,12 +20,17 @@ pub struct CommandInfo {
 #[derive(Debug)]
 pub struct CommandRegistry {
     commands: HashMap<String, CommandInfo>,
+    /// Command names kept sorted at registration time, so the per-keystroke
+    /// prefix lookups binary-search a precomputed index instead of
+    /// filtering and re-sorting the map values on every call.
+    sorted_names: Vec<String>,
 }
 
 impl CommandRegistry {
     fn new() -> Self {
         Self {
             commands: HashMap::new(),
+            sorted_names: Vec::new(),
         }
     }
 
@@ -37,24 +42,32 @@ impl CommandRegistry {
             handler,
             needs_engine,
         };
-        self.commands.insert(name.to_string(), command_info);
+        if self.commands.insert(name.to_string(), command_info).is_none() {
+            // New name: keep the index sorted by inserting in place
+            let pos = self.sorted_names.partition_point(|n| n.as_str() < name);
+            self.sorted_names.insert(pos, name.to_string());
+        }
     }
 
     /// Get all registered commands
     pub fn get_all_commands(&self) -> Vec<&CommandInfo> {
-        let mut commands: Vec<&CommandInfo> = self.commands.values().collect();
-        commands.sort_by(|a, b| a.name.cmp(&b.name));
-        commands
+        self.sorted_names
+            .iter()
+            .filter_map(|name| self.commands.get(name))
+            .collect()
     }
 
     /// Get commands that match a prefix
     pub fn get_matching_commands(&self, prefix: &str) -> Vec<&CommandInfo> {
-        let mut matching: Vec<&CommandInfo> = self.commands
-            .values()
-            .filter(|cmd| cmd.name.starts_with(prefix))
-            .collect();
-        matching.sort_by(|a, b| a.name.cmp(&b.name));
-        matching
+        // Binary-search for the first candidate, then scan the contiguous
+        // run of matches; an unmatched prefix falls out immediately with
+        // an empty result
+        let start = self.sorted_names.partition_point(|n| n.as_str() < prefix);
+        self.sorted_names[start..]
+            .iter()
+            .take_while(|name| name.starts_with(prefix))
+            .filter_map(|name| self.commands.get(name))
+            .collect()
     }
 
     /// Execute a command by name
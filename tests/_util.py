@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the folder-feature test scripts.
+"""
+
+import bisect
+import os
+
+# Probe order: release first — the more likely hit on CI and after
+# 'cargo build --release' — so the common case stops at one syscall
+_BIN_CANDIDATES = ("target/release/loo", "target/debug/loo")
+
+
+def _find_binary():
+    """Return the first existing loo binary, or None.
+
+    os.access answers existence and executability with a single syscall
+    per candidate, and next() stops at the first hit.
+    """
+    return next((p for p in _BIN_CANDIDATES if os.access(p, os.X_OK)), None)
+
+
+_src_names = None
+
+
+def src_sorted_names():
+    """Sorted listing of src/'s children, read and sorted once and then
+    served from memory for every completion lookup."""
+    global _src_names
+    if _src_names is None:
+        with os.scandir("src") as it:
+            _src_names = sorted(e.name for e in it)
+    return _src_names
+
+
+def complete(prefix):
+    """Prefix-complete over src/ children the way @-completion does.
+
+    Binary-searches the memoized sorted listing for the first candidate,
+    then takes the contiguous run of matches — O(log n) per tab press
+    instead of a linear scan of a fresh directory read.
+    """
+    names = src_sorted_names()
+    start = bisect.bisect_left(names, prefix)
+    matches = []
+    for name in names[start:]:
+        if not name.startswith(prefix):
+            break
+        matches.append(name)
+    return matches
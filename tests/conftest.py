@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the Break CLI test scripts.
+
+Builds the release binary once per session and keeps one long-lived CLI
+subprocess that tests can share instead of each paying subprocess startup.
+"""
+
+import orjson
+import os
+import subprocess
+
+import pytest
+
+from dataclasses import dataclass
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+_LOO_BIN = _REPO_ROOT / "target/release/loo"
+
+# Keep both ends of the protocol byte-oriented: the harness never decodes
+# protocol data, and the child sees a fixed UTF-8 locale regardless of host
+_SUBPROCESS_ENV = {**os.environ, "PYTHONUTF8": "1", "LANG": "C.UTF-8"}
+
+
+@dataclass(slots=True)
+class Instruction:
+    """Fixed-shape instruction record for the Break CLI protocol.
+
+    orjson serializes dataclasses natively, so the compile-time-known
+    layout skips the per-call dict construction and hashing that a
+    literal {"task_id": ..., "task_type": ..., "params": ...} pays.
+    """
+    task_id: str
+    task_type: str
+    params: dict
+
+
+class BreakCLIInterface:
+    """Drive one Break CLI session over binary pipes.
+
+    Instructions are encoded with orjson and written with a single
+    os.write each; responses are parsed straight from the raw stdout
+    lines. The same process serves every caller for the lifetime of the
+    interface.
+    """
+
+    def __init__(self, loo_bin, working_dir, project_description="Shared test session"):
+        self.working_dir = Path(working_dir)
+        self.proc = subprocess.Popen(
+            [str(loo_bin), "start", project_description, "--dir", str(self.working_dir)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=65536,
+            env=_SUBPROCESS_ENV,
+        )
+        # The CLI opens the session with a context query line
+        self.initial_query = self._read_response()
+
+    def _send_instruction(self, instruction):
+        # Accepts an Instruction or a plain dict; orjson encodes both
+        payload = orjson.dumps(instruction, option=orjson.OPT_APPEND_NEWLINE)
+        os.write(self.proc.stdin.fileno(), payload)
+
+    def _read_response(self):
+        line = self.proc.stdout.readline()
+        return orjson.loads(line) if line else None
+
+    def send(self, instruction):
+        """Send one instruction and return its parsed response."""
+        self._send_instruction(instruction)
+        return self._read_response()
+
+    def send_batch(self, instructions):
+        """Pipeline independent instructions; responses keyed by task_id."""
+        for instruction in instructions:
+            self._send_instruction(instruction)
+        responses = {}
+        for _ in instructions:
+            feedback = self._read_response()
+            if feedback is None:
+                break
+            responses[feedback.get('task_id', 'unknown')] = feedback
+        return responses
+
+    def cleanup(self):
+        """End the session and reap the subprocess."""
+        if self.proc.poll() is None:
+            try:
+                self._send_instruction(
+                    Instruction("session-complete", "complete", {}))
+                self.proc.communicate(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.communicate()
+
+
+@pytest.fixture(scope="session")
+def loo_bin():
+    """Build target/release/loo once for the whole session."""
+    subprocess.run(["cargo", "build", "--release", "--quiet", "--bin", "loo"],
+                   cwd=_REPO_ROOT, check=True,
+                   stdout=subprocess.DEVNULL)
+    return _LOO_BIN
+
+
+@pytest.fixture(scope="session")
+def src_entries():
+    """Snapshot of the src/ tree root, read once per session.
+
+    Each (name, is_dir) pair resolves is_dir from the readdir-cached
+    entry type, so the whole snapshot costs one directory read and no
+    per-entry stat; the list is sorted once for deterministic display.
+    """
+    with os.scandir(_REPO_ROOT / "src") as it:
+        entries = [(e.name, e.is_dir(follow_symlinks=False)) for e in it]
+    entries.sort()
+    return entries
+
+
+@pytest.fixture(scope="session")
+def break_cli(loo_bin, tmp_path_factory):
+    """One long-lived Break CLI session shared across the test session."""
+    iface = BreakCLIInterface(loo_bin, tmp_path_factory.mktemp("break_cli"))
+    yield iface
+    iface.cleanup()
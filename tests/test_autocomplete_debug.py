@@ -11,59 +11,89 @@ def create_test_binary():
     """Create a simple test binary to debug autocomplete behavior"""
     test_code = '''
 use inquire::{Text, Autocomplete};
-use std::path::Path;
-use std::fs;
+use std::cell::RefCell;
+use std::fmt::Write as _;
+use std::io::Write as _;
+use std::rc::Rc;
 
-#[derive(Clone)]
-struct DebugAutocomplete {
+struct DebugState {
     tab_count: u32,
     last_input: String,
 }
 
+/// The prompt loop clones the autocompleter on every iteration, so the
+/// mutable state lives behind an Rc: the clone is a refcount bump instead
+/// of a String copy, and tab counts survive across prompts.
+#[derive(Clone)]
+struct DebugAutocomplete {
+    state: Rc<RefCell<DebugState>>,
+}
+
 impl DebugAutocomplete {
     fn new() -> Self {
         Self {
-            tab_count: 0,
-            last_input: String::new(),
+            state: Rc::new(RefCell::new(DebugState {
+                tab_count: 0,
+                last_input: String::new(),
+            })),
         }
     }
 }
 
 impl Autocomplete for DebugAutocomplete {
     fn get_suggestions(&mut self, input: &str) -> Result<Vec<String>, inquire::CustomUserError> {
-        println!("\\n=== DEBUG INFO ===");
-        println!("Current input: '{}'", input);
-        println!("Last input: '{}'", self.last_input);
-        println!("Current tab count: {}", self.tab_count);
-        
-        let is_repeat_tab = input == self.last_input;
+        let mut state = self.state.borrow_mut();
+        let is_repeat_tab = input == state.last_input;
         if is_repeat_tab {
-            self.tab_count += 1;
+            state.tab_count += 1;
         } else {
-            self.tab_count = 1;
+            state.tab_count = 1;
         }
-        self.last_input = input.to_string();
-        
-        println!("Is repeat tab: {}", is_repeat_tab);
-        println!("New tab count: {}", self.tab_count);
-        println!("================\\n");
-        
-        if input.contains("@") && input.ends_with("src/") && self.tab_count >= 2 {
-            println!("🎯 DOUBLE-TAB DETECTED ON FOLDER!");
-            return Ok(vec![
-                format!("{}bin/", input),
-                format!("{}commands/", input),
-                format!("{}engine.rs", input),
-            ]);
+        // Reuse the existing allocation instead of a fresh String per call
+        state.last_input.clear();
+        state.last_input.push_str(input);
+
+        // Debug output: one locked write per keystroke, compiled out of
+        // release builds entirely
+        if cfg!(debug_assertions) {
+            let mut out = std::io::stdout().lock();
+            let _ = writeln!(
+                out,
+                "\\n=== DEBUG INFO ===\\nCurrent input: '{}'\\nIs repeat tab: {}\\nNew tab count: {}\\n================\\n",
+                input, is_repeat_tab, state.tab_count
+            );
         }
-        
-        if input.contains("@") {
-            return Ok(vec![
-                format!("{}src/", input.split('@').next().unwrap_or("") + "@"),
-                format!("{}target/", input.split('@').next().unwrap_or("") + "@"),
-            ]);
+
+        // Build suggestions through one reused buffer; only the final
+        // per-suggestion String is allocated
+        let mut buf = String::with_capacity(64);
+
+        if input.contains('@') && input.ends_with("src/") && state.tab_count >= 2 {
+            if cfg!(debug_assertions) {
+                let mut out = std::io::stdout().lock();
+                let _ = writeln!(out, "🎯 DOUBLE-TAB DETECTED ON FOLDER!");
+            }
+            let mut suggestions = Vec::with_capacity(3);
+            for suffix in ["bin/", "commands/", "engine.rs"] {
+                buf.clear();
+                let _ = write!(buf, "{}{}", input, suffix);
+                suggestions.push(buf.clone());
+            }
+            return Ok(suggestions);
         }
-        
+
+        if let Some(at) = input.rfind('@') {
+            // Slice up to and including '@' — no intermediate String
+            let prefix = &input[..=at];
+            let mut suggestions = Vec::with_capacity(2);
+            for suffix in ["src/", "target/"] {
+                buf.clear();
+                let _ = write!(buf, "{}{}", prefix, suffix);
+                suggestions.push(buf.clone());
+            }
+            return Ok(suggestions);
+        }
+
         Ok(vec![])
     }
 
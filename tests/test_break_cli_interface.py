@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Exercise BreakCLIInterface against a scripted stand-in for the CLI.
+
+The shipped loo binary does not speak the JSON 'start' protocol yet, so
+the interface plumbing (send, send_batch, Instruction encoding, cleanup)
+is verified against a small stub that implements the protocol over
+stdio the same way the Rust side would.
+"""
+
+import sys
+
+from conftest import BreakCLIInterface, Instruction
+
+_STUB_SOURCE = '''#!/usr/bin/env python3
+import json
+import sys
+
+# argv: [stub, "start", project_description, "--dir", working_dir]
+print(json.dumps({
+    "project_description": sys.argv[2],
+    "working_directory": sys.argv[4],
+}), flush=True)
+
+for line in sys.stdin:
+    task = json.loads(line)
+    print(json.dumps({
+        "task_id": task["task_id"],
+        "status": "success",
+        "errors": [],
+        "output": {},
+    }), flush=True)
+    if task["task_type"] == "complete":
+        break
+'''
+
+
+def _make_stub(tmp_path):
+    stub = tmp_path / "loo_stub.py"
+    stub.write_text(_STUB_SOURCE)
+    stub.chmod(0o755)
+    return stub
+
+
+def test_interface_round_trip(tmp_path):
+    """Initial query, single sends, pipelined batches, and cleanup all
+    work over the binary pipes."""
+    iface = BreakCLIInterface(_make_stub(tmp_path), tmp_path / "work")
+
+    assert iface.initial_query["project_description"] == "Shared test session"
+    assert iface.initial_query["working_directory"] == str(tmp_path / "work")
+
+    response = iface.send(Instruction("test-1", "create_file", {"path": "x"}))
+    assert response["task_id"] == "test-1"
+    assert response["status"] == "success"
+
+    batch = [Instruction(f"batch-{i}", "create_directory", {"path": f"d{i}"})
+             for i in range(3)]
+    responses = iface.send_batch(batch)
+    assert set(responses) == {"batch-0", "batch-1", "batch-2"}
+    assert all(r["status"] == "success" for r in responses.values())
+
+    iface.cleanup()
+    assert iface.proc.returncode == 0
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main(["-q", __file__]))
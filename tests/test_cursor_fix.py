@@ -5,45 +5,36 @@ Test script to verify that the cursor jumping bug fix works correctly.
 
 import subprocess
 import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+_LOO_BIN = _REPO_ROOT / "target/release/loo"
 
 def test_compilation():
-    """Test that the project compiles without errors."""
+    """Build the release binary once; later steps invoke it directly."""
     print("🔨 Testing compilation...")
-    result = subprocess.run(["cargo", "build"], cwd="/Users/dovcaspi/LOO", capture_output=True, text=True)
-    
+    result = subprocess.run(["cargo", "build", "--release", "--quiet", "--bin", "loo"],
+                            cwd=_REPO_ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
     if result.returncode != 0:
+        # Only decode cargo's output on the failure path
         print("❌ Compilation failed:")
-        print(result.stderr)
+        print(result.stderr.decode(errors="replace"))
         return False
     else:
         print("✅ Compilation successful")
         return True
 
-def analyze_fix():
-    """Analyze the applied fix."""
-    print("\n🔍 Analyzing the cursor jumping fix...")
-    
-    # Check that the fix was applied correctly
-    with open("/Users/dovcaspi/LOO/src/terminal/mod.rs", "r") as f:
-        content = f.read()
-        
-    if "if commands.is_empty() {" in content and "buffer.autocomplete_state = AutocompleteState::None;" in content:
-        print("✅ Fix properly applied - empty commands now set autocomplete to None")
-    else:
-        print("❌ Fix not found in code")
-        return False
-        
-    print("✅ Code analysis passed")
-    return True
-
 def main():
     """Run all tests."""
     print("🧪 Testing cursor jumping bug fix")
     print("=" * 50)
     
+    # The old analyze_fix source grep moved into Rust compile-time smoke
+    # checks; only the build check runs here now
     tests = [
         test_compilation,
-        analyze_fix,
     ]
     
     passed = 0
@@ -1,46 +1,55 @@
 #!/usr/bin/env python3
 """
-Test script to reproduce the cursor positioning issue with /list-models command.
-This simulates the problem described in the issue.
+Test for the cursor positioning issue with the /list-models command.
+
+Instead of a timed print-based simulation, the terminal byte sequences
+involved are replayed through an in-process ANSI terminal emulator (pyte)
+and the resulting cursor position is asserted directly — deterministic,
+no sleeps, no subprocess.
 """
 
 import sys
-import time
-
-def simulate_terminal_input():
-    """Simulate the terminal input behavior that causes the cursor positioning issue"""
-    
-    print("=== Simulating Cursor Position Issue ===")
-    print()
-    
-    # Simulate user typing without pressing Enter
-    print("User types: '/list-mode'", end="", flush=True)
-    time.sleep(1)
-    
-    # User continues typing
-    print("ls'", end="", flush=True)
-    time.sleep(0.5)
-    
-    # Now user presses Enter - this would trigger the command
-    print()  # This represents the Enter key
-    
-    # The issue: println! output starts from where cursor was, not beginning of line
-    print("Expected behavior:")
-    print("📋 Available models (5):")
-    print("  • model1")
-    print("  • model2")
-    print()
-    
-    print("ACTUAL PROBLEMATIC behavior (cursor positioned after 'ls'):")
-    # Simulate the cursor being positioned after "ls" when printing results
-    print("User types: '/list-models'", end="", flush=True)
-    print("                    📋 Available models (5):")  # This shows the issue
-    print("                      • model1")
-    print("                      • model2")
-    print()
-    
-    print("The issue is that println! doesn't move cursor to beginning of new line")
-    print("It just prints where the cursor currently is positioned.")
+import pyte
+
+# The user has typed a partial command; no Enter has been pressed yet
+_TYPED = "User types: '/list-models'"
+_OUTPUT = "Available models (5):"
+
+def _render(data):
+    """Feed raw terminal output into an 80x24 emulated screen."""
+    screen = pyte.Screen(80, 24)
+    stream = pyte.Stream(screen)
+    stream.feed(data)
+    return screen
+
+def test_bare_linefeed_reproduces_cursor_drift():
+    """println!-style output after a partial input line starts at the old
+    column: the bug from the issue report."""
+    screen = _render(_TYPED + "\n" + _OUTPUT)
+
+    # The linefeed moved the cursor down but kept the column, so the
+    # command output begins mid-line instead of at column zero
+    assert screen.cursor.y == 1
+    assert screen.cursor.x == len(_TYPED) + len(_OUTPUT)
+    assert screen.display[1].startswith(" " * len(_TYPED))
+
+def test_carriage_return_fixes_cursor_position():
+    """Emitting \\r\\n before the output resets the column, which is the
+    behavior the fix must produce."""
+    screen = _render(_TYPED + "\r\n" + _OUTPUT)
+
+    assert screen.cursor.y == 1
+    assert screen.cursor.x == len(_OUTPUT)
+    assert screen.display[1].startswith(_OUTPUT)
 
 if __name__ == "__main__":
-    simulate_terminal_input()
\ No newline at end of file
+    print("🧪 Testing cursor positioning for /list-models output")
+    print("=" * 50)
+
+    test_bare_linefeed_reproduces_cursor_drift()
+    print("✅ Bare \\n reproduces the cursor drift")
+    test_carriage_return_fixes_cursor_position()
+    print("✅ \\r\\n starts the output at column zero")
+
+    print("\n🎉 All assertions passed!")
+    sys.exit(0)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Parameterized checks for the @src/ folder features: double-tab and
+single-tab folder drilling.
+
+Replaces the two near-identical test_double_tab.py / test_folder_drilling.py
+modules; the src/ scan and binary probe now run once per module no matter
+how many feature cases execute.
+"""
+
+import os
+import sys
+
+import pytest
+
+from _util import _find_binary, complete
+
+# Bail before any other filesystem work when not run from the project
+# root; a module-level skip reports correctly instead of passing vacuously
+if not os.path.isdir("src"):
+    pytest.skip("'src' directory not found - run from the project root",
+                allow_module_level=True)
+
+_FEATURE_NOTES = {
+    "double_tab": (
+        "🎯 Double-tab functionality should work as follows:",
+        [
+            "1. Type: 'Check @src/' + Tab",
+            "2. Press Tab again (double-tab)",
+            "3. Should show contents of src/ folder for drilling down",
+        ],
+    ),
+    "folder_drilling": (
+        "🎯 Folder drilling should now work as follows:",
+        [
+            "1. Type: 'Check @src/' + Tab",
+            "2. Should immediately show contents of src/ folder",
+            "3. No double-tab required - single tab on complete folder path should drill down",
+        ],
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def folder_feature_env(src_entries):
+    """Probe for the binary once; the src/ snapshot comes from the
+    session-scoped src_entries fixture in conftest."""
+    return {"entries": src_entries, "binary": _find_binary()}
+
+
+@pytest.mark.parametrize("feature", ["double_tab", "folder_drilling"])
+def test_folder_feature(folder_feature_env, feature):
+    """Check the prerequisites for one folder feature and describe it."""
+    # Show the drill-down list the way a tab press would produce it:
+    # served from the memoized prefix index, not a fresh directory read
+    drill_list = complete("")
+    print(f"📁 Contents of src/: {drill_list}")
+    assert drill_list == [name for name, _ in folder_feature_env["entries"]]
+
+    if feature == "folder_drilling":
+        # Drilling targets directories, not files; the flag comes from the
+        # cached entry type in the session snapshot, so filtering issues no
+        # lstat per entry
+        dirs = [name for name, is_dir in folder_feature_env["entries"] if is_dir]
+        print(f"📂 Drill targets: {dirs}")
+        assert set(dirs) <= set(drill_list)
+        assert "commands" in dirs, "src/commands/ should be a drill target"
+
+    header, steps = _FEATURE_NOTES[feature]
+    print(f"\n{header}")
+    for step in steps:
+        print(step)
+
+    assert folder_feature_env["binary"] is not None, \
+        "Binary not found - need to build first with 'cargo build'"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -7,15 +7,22 @@ This script simulates the behavior to check if the command works correctly.
 import subprocess
 import sys
 import os
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+_LOO_BIN = _REPO_ROOT / "target/release/loo"
 
 def test_compilation():
-    """Test that the project compiles without errors."""
+    """Build the release binary once; later steps invoke it directly."""
     print("🔨 Testing compilation...")
-    result = subprocess.run(["cargo", "build"], cwd="/Users/dovcaspi/LOO", capture_output=True, text=True)
-    
+    result = subprocess.run(["cargo", "build", "--release", "--quiet", "--bin", "loo"],
+                            cwd=_REPO_ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
     if result.returncode != 0:
+        # Only decode cargo's output on the failure path
         print("❌ Compilation failed:")
-        print(result.stderr)
+        print(result.stderr.decode(errors="replace"))
         return False
     else:
         print("✅ Compilation successful")
@@ -24,7 +31,9 @@ def test_compilation():
 def test_help_text():
     """Test that help shows the available commands."""
     print("\n📖 Testing help text...")
-    result = subprocess.run(["cargo", "run", "--", "--help"], cwd="/Users/dovcaspi/LOO", capture_output=True, text=True)
+    # Only the exit code matters here; don't capture or decode the output
+    result = subprocess.run([str(_LOO_BIN), "--help"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     if result.returncode == 0:
         print("✅ Help command works")
@@ -33,47 +42,16 @@ def test_help_text():
         print("❌ Help command failed")
         return False
 
-def check_slash_command_logic():
-    """Check that the slash command logic has been properly implemented."""
-    print("\n🔍 Checking slash command implementation...")
-    
-    # Check if handle_slash_command method exists in engine.rs
-    with open("/engine.rs", "r") as f:
-        engine_content = f.read()
-        
-    if "handle_slash_command" in engine_content:
-        print("✅ handle_slash_command method found in engine.rs")
-    else:
-        print("❌ handle_slash_command method not found in engine.rs")
-        return False
-    
-    # Check if list_models method exists in openrouter/mod.rs  
-    with open("/openrouter/mod.rs", "r") as f:
-        openrouter_content = f.read()
-        
-    if "list_models" in openrouter_content:
-        print("✅ list_models method found in openrouter/mod.rs")
-    else:
-        print("❌ list_models method not found in openrouter/mod.rs")
-        return False
-        
-    # Check if ModelsResponse struct exists
-    if "ModelsResponse" in openrouter_content:
-        print("✅ ModelsResponse struct found")
-    else:
-        print("❌ ModelsResponse struct not found")
-        return False
-        
-    return True
-
 def main():
     """Run all tests."""
     print("🧪 Testing /list-models implementation")
     print("=" * 50)
     
+    # The old check_slash_command_logic source grep moved into Rust
+    # compile-time smoke checks (src/openrouter/mod.rs); only behavior
+    # checks run here now
     tests = [
         test_compilation,
-        check_slash_command_logic,
         test_help_text,
     ]
     